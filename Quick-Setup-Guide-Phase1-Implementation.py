@@ -81,7 +81,9 @@ from backend.models.agent_models import (
 Environment-based config in `backend/config/settings.py`:
 
 ```python
-from backend.config import settings
+from backend.config import get_settings
+
+settings = get_settings()
 
 # Access configuration
 print(f"LLM Provider: {settings.llm_provider}")
@@ -42,7 +42,9 @@ class ExecutionContext(BaseModel):
     """Context information for agent execution."""
     model_config = ConfigDict(
         json_encoders={datetime: lambda v: v.isoformat()},
-        use_enum_values=True
+        use_enum_values=True,
+        frozen=True,
+        extra="forbid"
     )
     
     session_id: str
@@ -64,7 +66,9 @@ class TaskRequest(BaseModel):
     """Request to execute a task."""
     model_config = ConfigDict(
         use_enum_values=True,
-        json_encoders={datetime: lambda v: v.isoformat()}
+        json_encoders={datetime: lambda v: v.isoformat()},
+        frozen=True,
+        extra="forbid"
     )
     
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
@@ -98,7 +102,9 @@ class TaskResult(BaseModel):
     """Result of task execution."""
     model_config = ConfigDict(
         use_enum_values=True,
-        json_encoders={datetime: lambda v: v.isoformat()}
+        json_encoders={datetime: lambda v: v.isoformat()},
+        frozen=True,
+        extra="forbid"
     )
     
     task_id: str
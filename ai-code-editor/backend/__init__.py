@@ -1 +1 @@
-"""AI Code Editor Backend Package."""\n
\ No newline at end of file
+"""AI Code Editor Backend Package."""
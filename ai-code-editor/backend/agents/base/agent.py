@@ -20,7 +20,7 @@ class BaseAgent(ABC):
         pass
     
     @abstractmethod
-    async def can_handle(self, task: TaskRequest) -> bool:
+    def can_handle(self, task: TaskRequest) -> bool:
         """Check if this agent can handle the given task."""
         pass
     
@@ -134,11 +134,18 @@ Code generation agent.
 import json
 import uuid
 from ...agents.base.agent import BaseAgent
-from ...models.agent_models import AgentType, TaskRequest, TaskResult, TaskStatus, IntentType
+from ...models.agent_models import (
+    AgentType, TaskRequest, TaskResult, TaskStatus, INTENT_CODE_GENERATION
+)
 
 class CodeGenerationAgent(BaseAgent):
     """Agent specialized in code generation."""
     
+    _SYSTEM_MSG = {
+        "role": "system",
+        "content": "You are a code generation expert. Generate clean, well-documented code based on user requests."
+    }
+    
     def __init__(self, llm_client=None):
         super().__init__(AgentType.CODE)
         self.llm_client = llm_client
@@ -150,23 +157,17 @@ class CodeGenerationAgent(BaseAgent):
             "Code refactoring"
         ]
     
-    async def can_handle(self, task: TaskRequest) -> bool:
+    def can_handle(self, task: TaskRequest) -> bool:
         """Check if this agent can handle the task."""
-        return task.intent == IntentType.CODE_GENERATION
+        return task.intent == INTENT_CODE_GENERATION
     
     async def execute(self, task: TaskRequest) -> TaskResult:
         """Execute code generation task."""
         try:
             # Build prompt with context
             messages = [
-                {
-                    "role": "system",
-                    "content": "You are a code generation expert. Generate clean, well-documented code based on user requests."
-                },
-                {
-                    "role": "user", 
-                    "content": task.description
-                }
+                self._SYSTEM_MSG,
+                {"role": "user", "content": task.description}
             ]
             
             # Get response from LLM
@@ -183,7 +184,7 @@ class CodeGenerationAgent(BaseAgent):
                     "explanation": "Generated code based on your request."
                 }
             
-            return TaskResult(
+            return TaskResult.model_construct(
                 task_id=task.id,
                 agent_type=self.agent_type,
                 status=TaskStatus.COMPLETED,
@@ -235,8 +236,9 @@ API endpoints for the agentic middleware.
 """
 
 import logging
-from fastapi import APIRouter, HTTPException
-from ...models.agent_models import ChatMessage, ExecutionContext
+import time
+from fastapi import APIRouter, HTTPException, Response
+from ...models.agent_models import ChatMessage, ChatResponse
 from ...core.orchestration.middleware import AgenticMiddleware
 
 logger = logging.getLogger("middleware_api")
@@ -254,22 +256,21 @@ async def chat(message: ChatMessage):
         raise HTTPException(status_code=503, detail="Middleware not initialized")
     
     try:
-        # Create execution context
-        context = ExecutionContext(
-            session_id=message.session_id,
-            user_id=message.user_id,
-            project_id=message.project_id,
-            workspace_path=message.workspace_path
-        )
+        start_time = time.perf_counter()
+        
+        # Get the (cached) execution context for this session
+        context = middleware.get_context(message)
         
         # Process through middleware
         response = await middleware.process_request(message.message, context)
         
-        return {
-            "session_id": message.session_id,
-            "response": response,
-            "timestamp": "2024-01-01T00:00:00Z"
-        }
+        chat_response = ChatResponse(
+            session_id=message.session_id,
+            response=response,
+            processing_time=time.perf_counter() - start_time,
+            timestamp="2024-01-01T00:00:00Z"
+        )
+        return Response(content=chat_response.to_api(), media_type="application/json")
         
     except Exception as e:
         logger.error(f"Error processing chat message: {e}")
@@ -299,7 +300,9 @@ async def health():
     """Health check endpoint."""
     return {
         "status": "healthy",
-        "middleware_active": middleware is not None
+        "middleware_active": middleware is not None,
+        "cache_hits": middleware.cache_hits if middleware else 0,
+        "cache_misses": middleware.cache_misses if middleware else 0
     }
 
 
@@ -1 +1,3 @@
-from .settings import settings, get_settings\n\n__all__ = ["settings", "get_settings"]\n
\ No newline at end of file
+from .settings import get_settings
+
+__all__ = ["get_settings"]
@@ -3,15 +3,21 @@ Application configuration management - Pydantic V2 Compatible.
 """
 
 import os
+from functools import lru_cache
 from typing import Optional
 from pydantic import BaseModel, Field
-from pydantic_settings import BaseSettings
-from .models.agent_models import LLMConfig, AgentConfig, SystemConfig, AgentType
+from pydantic_settings import BaseSettings, SettingsConfigDict
+from ..models.agent_models import LLMConfig, AgentConfig, SystemConfig, AgentType
 
 
 class Settings(BaseSettings):
     """Application settings with environment variable support."""
     
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        case_sensitive=False
+    )
+    
     # Server settings
     app_name: str = "AI Code Editor"
     app_version: str = "0.1.0"
@@ -46,11 +52,6 @@ class Settings(BaseSettings):
     # Logging
     log_level: str = "INFO"
     log_format: str = "json"
-    
-    class Config:
-        """Pydantic config."""
-        env_file = ".env"
-        case_sensitive = False
 
     def get_llm_config(self) -> LLMConfig:
         """Get LLM configuration."""
@@ -86,10 +87,14 @@ class Settings(BaseSettings):
         )
 
 
-# Global settings instance
-settings = Settings()
+@lru_cache(maxsize=None)
+def get_settings() -> Settings:
+    """Get application settings, reading the environment on first use."""
+    return Settings()
 
 
-def get_settings() -> Settings:
-    """Get application settings."""
-    return settings
+def __getattr__(name: str):
+    """Resolve the global ``settings`` instance lazily."""
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1 +1 @@
-"""Core system components."""\n
\ No newline at end of file
+"""Core system components."""
@@ -0,0 +1,37 @@
+"""
+Session context memory backed by Redis.
+"""
+
+import logging
+from typing import Any, Dict, Optional
+
+import orjson
+import redis.asyncio as redis
+
+SESSION_PREFIX = "cfn:session:"
+SESSION_TTL = 3600  # seconds
+
+
+class ContextMemory:
+    """Stores per-session context in Redis."""
+    
+    def __init__(self, redis_url: str = "redis://localhost:6379"):
+        # The client only connects on its first command
+        self.redis = redis.from_url(redis_url)
+        self.logger = logging.getLogger("context_memory")
+    
+    async def initialize(self):
+        """Check that Redis is reachable; requests still work without it."""
+        try:
+            await self.redis.ping()
+        except redis.RedisError as e:
+            self.logger.warning("Redis unavailable, running without memory: %s", e)
+    
+    async def get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Load a session's stored context, or None if it has none."""
+        data = await self.redis.get(SESSION_PREFIX + session_id)
+        return orjson.loads(data) if data is not None else None
+    
+    async def save_session(self, session_id: str, context: Dict[str, Any]):
+        """Store a session's context, refreshing its expiry."""
+        await self.redis.set(SESSION_PREFIX + session_id, orjson.dumps(context), ex=SESSION_TTL)
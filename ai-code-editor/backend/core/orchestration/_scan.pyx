@@ -0,0 +1,26 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Byte-level keyword scan for long intent classifier inputs.
+
+Opt-in and not built by default: compile in place with
+`cythonize -i core/orchestration/_scan.pyx`. It is only used when
+pyahocorasick is not installed.
+"""
+
+cdef extern from "string.h" nogil:
+    void *memmem(const void *haystack, size_t haystacklen,
+                 const void *needle, size_t needlelen)
+
+
+cpdef int first_match(const unsigned char[::1] buf, tuple keywords):
+    """Return the index of the first keyword found in buf, or -1."""
+    cdef Py_ssize_t i
+    cdef bytes kw
+    cdef size_t n = buf.shape[0]
+    if n == 0:
+        return -1
+    for i in range(len(keywords)):
+        kw = keywords[i]
+        if memmem(&buf[0], n, <const char *>kw, len(kw)) != NULL:
+            return i
+    return -1
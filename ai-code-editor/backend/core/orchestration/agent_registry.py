@@ -3,7 +3,8 @@ Registry for managing available agents.
 """
 
 import logging
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 from ...models.agent_models import AgentType, TaskRequest
 
 class AgentRegistry:
@@ -11,28 +12,42 @@ class AgentRegistry:
     
     def __init__(self):
         self.agents: Dict[AgentType, 'BaseAgent'] = {}
+        self._capabilities_cache: Optional[Mapping[AgentType, Tuple[str, ...]]] = None
         self.logger = logging.getLogger("agent_registry")
     
     def register_agent(self, agent):
         """Register an agent."""
         self.agents[agent.agent_type] = agent
+        self._capabilities_cache = None
         self.logger.info(f"Registered agent: {agent.agent_type.value}")
     
     def get_agent(self, agent_type: AgentType):
         """Get an agent by type."""
         return self.agents.get(agent_type)
     
-    async def find_capable_agents(self, task: TaskRequest) -> List:
+    def find_capable_agents(self, task: TaskRequest) -> List:
         """Find agents capable of handling a task."""
         capable_agents = []
         for agent in self.agents.values():
-            if await agent.can_handle(task):
+            if agent.can_handle(task):
                 capable_agents.append(agent)
         return capable_agents
     
-    def get_all_capabilities(self):
-        """Get capabilities of all agents."""
-        capabilities = {}
-        for agent_type, agent in self.agents.items():
-            capabilities[agent_type] = agent.get_capabilities()
-        return capabilities
+    def find_first_capable(self, task: TaskRequest) -> Optional['BaseAgent']:
+        """Find the first agent capable of handling a task."""
+        for agent in self.agents.values():
+            if agent.can_handle(task):
+                return agent
+        return None
+    
+    def get_all_capabilities(self) -> Mapping[AgentType, Tuple[str, ...]]:
+        """Get capabilities of all agents (cached until the next registration).
+        
+        The result is read-only and shared between callers.
+        """
+        if self._capabilities_cache is None:
+            self._capabilities_cache = MappingProxyType({
+                agent_type: tuple(agent.get_capabilities())
+                for agent_type, agent in self.agents.items()
+            })
+        return self._capabilities_cache
@@ -2,55 +2,104 @@
 Execution engine for running agent workflows.
 """
 
+import asyncio
+import heapq
 import logging
-from datetime import datetime
-from typing import List
-from ...models.agent_models import TaskRequest, TaskResult, TaskStatus
+import time
+from typing import Dict, List
+from ...models.agent_models import (
+    TaskRequest, TaskResult, AGENT_UNKNOWN, STATUS_COMPLETED, STATUS_FAILED
+)
 
 class ExecutionEngine:
     """Executes agent workflows."""
     
-    def __init__(self, agent_registry, memory):
+    def __init__(self, agent_registry, memory, max_concurrent_tasks: int = 10):
         self.agent_registry = agent_registry
         self.memory = memory
+        self.max_concurrent_tasks = max_concurrent_tasks
         self.logger = logging.getLogger("execution_engine")
     
     async def execute_task(self, task: TaskRequest) -> TaskResult:
         """Execute a single task."""
-        start_time = datetime.utcnow()
+        start_ns = time.perf_counter_ns()
         
         try:
-            # Find capable agents
-            capable_agents = await self.agent_registry.find_capable_agents(task)
+            # Find a capable agent
+            selected_agent = self.agent_registry.find_first_capable(task)
             
-            if not capable_agents:
-                return TaskResult(
+            if selected_agent is None:
+                # Internally built from trusted values - skip validation
+                return TaskResult.model_construct(
                     task_id=task.id,
-                    agent_type="unknown",
-                    status=TaskStatus.FAILED,
+                    agent_type=AGENT_UNKNOWN,
+                    status=STATUS_FAILED,
                     error="No capable agents found"
                 )
             
             # Execute with first capable agent
-            selected_agent = capable_agents[0]
             result = await selected_agent.execute(task)
             
             return result
             
         except Exception as e:
-            execution_time = (datetime.utcnow() - start_time).total_seconds()
-            return TaskResult(
+            execution_time = (time.perf_counter_ns() - start_ns) / 1e9
+            return TaskResult.model_construct(
                 task_id=task.id,
-                agent_type="unknown",
-                status=TaskStatus.FAILED,
+                agent_type=AGENT_UNKNOWN,
+                status=STATUS_FAILED,
                 error=str(e),
                 execution_time=execution_time
             )
     
     async def execute_plan(self, plan) -> List[TaskResult]:
-        """Execute a complex plan."""
-        results = []
-        for task in plan.subtasks:
-            result = await self.execute_task(task)
-            results.append(result)
-        return results
+        """Execute a complex plan, dispatching ready subtasks on the critical path first."""
+        plan.validate()
+        
+        tasks = {task.id: task for task in plan.subtasks}
+        in_degree = {task_id: len(plan.dependencies.get(task_id, [])) for task_id in tasks}
+        results: Dict[str, TaskResult] = {}
+        
+        ready = [(-plan.priorities[task_id], task_id) for task_id in plan.roots]
+        heapq.heapify(ready)
+        running: Dict[asyncio.Task, str] = {}
+        
+        try:
+            while ready or running:
+                while ready and len(running) < self.max_concurrent_tasks:
+                    _, task_id = heapq.heappop(ready)
+                    running[asyncio.ensure_future(self.execute_task(tasks[task_id]))] = task_id
+                
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    task_id = running.pop(future)
+                    results[task_id] = future.result()
+                    if results[task_id].status != STATUS_COMPLETED:
+                        self._fail_dependents(plan, task_id, results)
+                        continue
+                    for dependent in plan.reverse_deps.get(task_id, []):
+                        in_degree[dependent] -= 1
+                        if in_degree[dependent] == 0:
+                            heapq.heappush(ready, (-plan.priorities[dependent], dependent))
+        finally:
+            # Don't leave subtasks running if the plan itself is cancelled
+            for future in running:
+                future.cancel()
+        
+        return [results[task.id] for task in plan.subtasks]
+    
+    def _fail_dependents(self, plan, task_id: str, results: Dict[str, TaskResult]):
+        """Fail everything downstream of a subtask that did not complete, without running it."""
+        stack = [task_id]
+        while stack:
+            prerequisite = stack.pop()
+            for dependent in plan.reverse_deps.get(prerequisite, []):
+                if dependent in results:
+                    continue
+                results[dependent] = TaskResult.model_construct(
+                    task_id=dependent,
+                    agent_type=AGENT_UNKNOWN,
+                    status=STATUS_FAILED,
+                    error=f"Skipped: prerequisite {prerequisite} did not complete"
+                )
+                stack.append(dependent)
@@ -2,17 +2,27 @@
 Intent classification for understanding user requests.
 """
 
-from typing import Dict, Any
-from enum import Enum
-from ...models.agent_models import ExecutionContext
+import asyncio
+import re
+from collections import OrderedDict
+from typing import Dict, Any, List, Tuple
+from ...models.agent_models import (
+    ExecutionContext, IntentType,
+    INTENT_CODE_GENERATION, INTENT_INFRASTRUCTURE_SETUP, INTENT_TESTING
+)
 
-class IntentType(str, Enum):
-    """Types of user intents."""
-    CODE_GENERATION = "code_generation"
-    INFRASTRUCTURE_SETUP = "infrastructure_setup"
-    TESTING = "testing"
-    DOCUMENTATION = "documentation"
-    SECURITY_SCAN = "security_scan"
+try:
+    import ahocorasick
+except ImportError:  # Optional C extension; fall back to substring scans
+    ahocorasick = None
+
+try:
+    from ._scan import first_match
+except ImportError:  # Opt-in: build with `cythonize -i core/orchestration/_scan.pyx`
+    first_match = None
+
+LONG_INPUT_THRESHOLD = 2048
+INTENT_CACHE_SIZE = 4096
 
 class IntentClassifier:
     """Classifies user intents from natural language."""
@@ -20,24 +30,104 @@ class IntentClassifier:
     def __init__(self, llm_client=None):
         self.llm_client = llm_client
         self.intent_examples = {
-            IntentType.CODE_GENERATION: [
+            INTENT_CODE_GENERATION: [
                 "create a function", "write code for", "implement", "generate"
             ],
-            IntentType.INFRASTRUCTURE_SETUP: [
+            INTENT_INFRASTRUCTURE_SETUP: [
                 "deploy to", "create dockerfile", "setup kubernetes"
             ],
-            IntentType.TESTING: [
+            INTENT_TESTING: [
                 "write tests", "create unit tests", "test coverage"
             ]
         }
+        self._intents = list(self.intent_examples)
+        # In-process LRU of recent classifications, keyed on (input, project)
+        self._l1: "OrderedDict[Tuple[str, str], IntentType]" = OrderedDict()
+        self._automaton = self._build_automaton()
+        self._patterns = [
+            (intent, re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE))
+            for intent, keywords in self.intent_examples.items()
+            if keywords
+        ]
+        # Flattened in priority order so the first hit maps to the best intent
+        self._scan_keywords = tuple(
+            keyword.lower().encode() for keywords in self.intent_examples.values() for keyword in keywords
+        )
+        self._scan_intents = [
+            intent for intent, keywords in self.intent_examples.items() for _ in keywords
+        ]
+    
+    def _build_automaton(self):
+        """Build a single multi-keyword matcher over all intent examples."""
+        if ahocorasick is None:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for rank, (intent, keywords) in enumerate(self.intent_examples.items()):
+            for keyword in keywords:
+                # Keep the highest-priority intent for keywords shared between intents
+                if keyword not in automaton:
+                    automaton.add_word(keyword, rank)
+        automaton.make_automaton()
+        return automaton
     
     async def classify(self, user_input: str, context: ExecutionContext) -> IntentType:
         """Classify user intent from input."""
-        user_input_lower = user_input.lower()
+        key = (user_input, context.project_id)
+        intent = self._cached(key)
+        if intent is None:
+            intent = self._match(user_input)
+            self._remember(key, intent)
+        return intent
+    
+    async def classify_batch(
+        self, user_inputs: List[str], contexts: List[ExecutionContext]
+    ) -> List[IntentType]:
+        """Classify many inputs, matching cache misses in a worker thread."""
+        keys = [(user_input, context.project_id) for user_input, context in zip(user_inputs, contexts)]
+        intents = [self._cached(key) for key in keys]
+        misses = [index for index, intent in enumerate(intents) if intent is None]
+        if misses:
+            matched = await asyncio.to_thread(lambda: [self._match(user_inputs[i]) for i in misses])
+            for index, intent in zip(misses, matched):
+                intents[index] = intent
+                self._remember(keys[index], intent)
+        return intents
+    
+    def _cached(self, key: Tuple[str, str]):
+        """Look up a recent classification, refreshing its LRU position."""
+        intent = self._l1.get(key)
+        if intent is not None:
+            self._l1.move_to_end(key)
+        return intent
+    
+    def _remember(self, key: Tuple[str, str], intent: IntentType):
+        """Cache a classification, evicting the least recently used one."""
+        self._l1[key] = intent
+        if len(self._l1) > INTENT_CACHE_SIZE:
+            self._l1.popitem(last=False)
+    
+    def _match(self, user_input: str) -> IntentType:
+        """Match an input against the intent keywords."""
+        if self._automaton is not None:
+            # One pass over the input; earlier intents take priority
+            best_rank = None
+            for _, rank in self._automaton.iter(user_input.lower()):
+                if best_rank is None or rank < best_rank:
+                    best_rank = rank
+                    if rank == 0:
+                        break
+            if best_rank is not None:
+                return self._intents[best_rank]
+            return INTENT_CODE_GENERATION
+        
+        if first_match is not None and len(user_input) > LONG_INPUT_THRESHOLD:
+            index = first_match(user_input.lower().encode(), self._scan_keywords)
+            return self._scan_intents[index] if index >= 0 else INTENT_CODE_GENERATION
         
-        # Simple keyword-based classification
-        for intent, keywords in self.intent_examples.items():
-            if any(keyword in user_input_lower for keyword in keywords):
+        # Keyword alternation per intent, scanned by the C regex engine
+        for intent, pattern in self._patterns:
+            if pattern.search(user_input):
                 return intent
         
-        return IntentType.CODE_GENERATION
+        return INTENT_CODE_GENERATION
@@ -3,35 +3,74 @@ Main Agentic Middleware class - orchestrates all AI agents.
 """
 
 import asyncio
+import hashlib
 import logging
-from typing import Dict, Any, Optional
-from datetime import datetime
+from collections import OrderedDict
+from functools import cached_property, lru_cache
+from typing import Dict, Any, List, Optional, Tuple
+from datetime import datetime, timezone
 
-from .intent_classifier import IntentClassifier
+import orjson
+import redis
+
+from .intent_classifier import IntentClassifier, IntentType
 from .task_planner import TaskPlanner
 from .execution_engine import ExecutionEngine
 from .agent_registry import AgentRegistry
 from ..memory.context_manager import ContextMemory
-from ..llm.gateway import LLMGateway
-from ...models.agent_models import ExecutionContext, TaskRequest
+from ...models.agent_models import (
+    ChatMessage, ExecutionContext, TaskRequest, STATUS_COMPLETED
+)
+
+RESPONSE_CACHE_PREFIX = "cfn:cache:"
+RESPONSE_CACHE_TTL = 3600  # seconds
+PLANNING_BUCKET_SIZE = 64  # description length bucket width, in characters
+LARGE_INPUT_THRESHOLD = 4096  # characters; larger tasks are validated off the event loop
+
+
+@lru_cache(maxsize=1024)
+def _plan_decision(intent: IntentType, desc_bucket: int) -> bool:
+    """Decide whether tasks of this shape go through the task planner."""
+    # No intent needs multi-step planning yet
+    return False
+
 
 class AgenticMiddleware:
     """Main orchestrator class that coordinates all agents."""
     
-    def __init__(self, redis_url: str = "redis://localhost:6379"):
+    def __init__(self, redis_url: str = "redis://localhost:6379", max_sessions: int = 1000):
         self.logger = logging.getLogger("agentic_middleware")
         
-        # Initialize components
-        self.agent_registry = AgentRegistry()
-        self.intent_classifier = IntentClassifier()
-        self.task_planner = TaskPlanner(self.agent_registry)
-        self.memory = ContextMemory(redis_url)
-        self.execution_engine = ExecutionEngine(
-            self.agent_registry,
-            self.memory
-        )
+        # Components are created on first use; see the properties below
+        self._redis_url = redis_url
         
         self.sessions = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+        
+        # LRU of immutable execution contexts, reused across a session's requests
+        self.max_sessions = max_sessions
+        self._ctx_cache: "OrderedDict[Tuple[str, str, str, str], ExecutionContext]" = OrderedDict()
+    
+    @cached_property
+    def agent_registry(self) -> AgentRegistry:
+        return AgentRegistry()
+    
+    @cached_property
+    def intent_classifier(self) -> IntentClassifier:
+        return IntentClassifier()
+    
+    @cached_property
+    def task_planner(self) -> TaskPlanner:
+        return TaskPlanner(self.agent_registry)
+    
+    @cached_property
+    def memory(self) -> ContextMemory:
+        return ContextMemory(self._redis_url)
+    
+    @cached_property
+    def execution_engine(self) -> ExecutionEngine:
+        return ExecutionEngine(self.agent_registry, self.memory)
     
     async def initialize(self):
         """Initialize the middleware."""
@@ -39,51 +78,210 @@ class AgenticMiddleware:
         await self.memory.initialize()
         self.logger.info("Agentic Middleware initialized successfully")
     
+    def get_context(self, message: ChatMessage) -> ExecutionContext:
+        """Get the execution context for a chat message, reusing it per session."""
+        key = (message.session_id, message.user_id, message.project_id, message.workspace_path)
+        context = self._ctx_cache.get(key)
+        if context is not None:
+            self._ctx_cache.move_to_end(key)
+            return context
+        
+        context = ExecutionContext(
+            session_id=message.session_id,
+            user_id=message.user_id,
+            project_id=message.project_id,
+            workspace_path=message.workspace_path
+        )
+        self._ctx_cache[key] = context
+        if len(self._ctx_cache) > self.max_sessions:
+            self._ctx_cache.popitem(last=False)
+        return context
+    
     async def process_request(self, user_input: str, context: ExecutionContext) -> Dict[str, Any]:
         """Process a user request through the agentic system."""
         try:
-            # Classify intent
-            intent = await self.intent_classifier.classify(user_input, context)
-            self.logger.info(f"Classified intent: {intent.value}")
+            cache_key = self._cache_key(user_input, context)
+            cached = await self._get_cached_response(cache_key)
+            if cached is not None:
+                return cached
             
-            # Create task request
-            task = TaskRequest(
-                intent=intent,
-                description=user_input,
-                context=context
+            # Classify intent while loading the session context
+            intent, session_ctx = await asyncio.gather(
+                self.intent_classifier.classify(user_input, context),
+                self._get_session(context.session_id)
             )
+            self.logger.info("Classified intent: %s", intent.value)
             
-            # Execute task
-            if await self._needs_planning(task):
-                plan = await self.task_planner.create_plan(task)
-                results = await self.execution_engine.execute_plan(plan)
-                response = await self._aggregate_results(results, plan)
-            else:
-                result = await self.execution_engine.execute_task(task)
-                response = await self._format_single_result(result)
+            return await self._execute_one(user_input, context, intent, session_ctx, cache_key)
             
-            return response
+        except Exception as e:
+            return self._error_response(e)
+    
+    async def process_batch(self, messages: List[ChatMessage]) -> List[Dict[str, Any]]:
+        """Process many chat messages, classifying and executing them together."""
+        # Identical requests are executed once and fanned back out in order
+        keys: List[Optional[str]] = []
+        failed: Dict[int, Dict[str, Any]] = {}
+        unique: Dict[str, Tuple[str, ExecutionContext]] = {}
+        for index, message in enumerate(messages):
+            try:
+                context = self.get_context(message)
+                key = self._cache_key(message.message, context)
+            except Exception as e:
+                # A message that cannot become a request fails on its own
+                failed[index] = self._error_response(e)
+                keys.append(None)
+                continue
+            keys.append(key)
+            unique.setdefault(key, (message.message, context))
+        
+        unique_keys = list(unique)
+        cached = await asyncio.gather(*[self._get_cached_response(key) for key in unique_keys])
+        responses = {key: hit for key, hit in zip(unique_keys, cached) if hit is not None}
+        misses = [key for key in unique_keys if key not in responses]
+        
+        if misses:
+            try:
+                intents, *sessions = await asyncio.gather(
+                    self.intent_classifier.classify_batch(
+                        [unique[key][0] for key in misses], [unique[key][1] for key in misses]
+                    ),
+                    *[self._get_session(unique[key][1].session_id) for key in misses]
+                )
+            except Exception as e:
+                error = self._error_response(e)
+                return [
+                    failed[index] if key is None else responses.get(key, error)
+                    for index, key in enumerate(keys)
+                ]
             
+            executed = await asyncio.gather(*[
+                self._execute_safely(*unique[key], intent, session_ctx, key)
+                for key, intent, session_ctx in zip(misses, intents, sessions)
+            ])
+            responses.update(zip(misses, executed))
+        
+        return [
+            failed[index] if key is None else responses[key]
+            for index, key in enumerate(keys)
+        ]
+    
+    async def _execute_one(
+        self,
+        user_input: str,
+        context: ExecutionContext,
+        intent: IntentType,
+        session_ctx: Optional[Dict[str, Any]],
+        cache_key: str
+    ) -> Dict[str, Any]:
+        """Build and execute the task for a classified request."""
+        # Create task request; agents reuse the loaded session context
+        parameters = {"session_context": session_ctx} if session_ctx else {}
+        task = await self._build_task(user_input, intent, context, parameters)
+        
+        # Execute task
+        if self._needs_planning(task):
+            plan = await self.task_planner.create_plan(task)
+            results = await self.execution_engine.execute_plan(plan)
+            response = await self._aggregate_results(results, plan)
+        else:
+            result = await self.execution_engine.execute_task(task)
+            response = await self._format_single_result(result)
+        
+        if response.get("status") == STATUS_COMPLETED.value:
+            await self._cache_response(cache_key, response)
+        
+        return response
+    
+    async def _build_task(
+        self,
+        user_input: str,
+        intent: IntentType,
+        context: ExecutionContext,
+        parameters: Dict[str, Any]
+    ) -> TaskRequest:
+        """Build a task request, validating very large inputs in a worker thread."""
+        if len(user_input) > LARGE_INPUT_THRESHOLD:
+            return await asyncio.to_thread(
+                TaskRequest,
+                intent=intent,
+                description=user_input,
+                context=context,
+                parameters=parameters
+            )
+        return TaskRequest(
+            intent=intent,
+            description=user_input,
+            context=context,
+            parameters=parameters
+        )
+    
+    async def _execute_safely(self, *args) -> Dict[str, Any]:
+        """Run _execute_one, converting failures into an error response."""
+        try:
+            return await self._execute_one(*args)
         except Exception as e:
-            self.logger.error(f"Error processing request: {e}")
-            return {
-                "error": str(e),
-                "status": "failed",
-                "timestamp": datetime.utcnow().isoformat()
-            }
+            return self._error_response(e)
+    
+    def _error_response(self, error: Exception) -> Dict[str, Any]:
+        """Build the response returned for a failed request."""
+        self.logger.exception("Error processing request: %s", error)
+        return {
+            "error": str(error),
+            "status": "failed",
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="milliseconds")
+        }
     
     def register_agent(self, agent):
         """Register a new agent with the middleware."""
         self.agent_registry.register_agent(agent)
     
-    async def _needs_planning(self, task: TaskRequest) -> bool:
+    def _cache_key(self, user_input: str, context: ExecutionContext) -> str:
+        """Build the response cache key for a request."""
+        # Responses depend on the caller's session context, so never share them across sessions
+        raw = (
+            f"{user_input.strip()}|{context.session_id}|{context.user_id}"
+            f"|{context.project_id}|{context.workspace_path}"
+        )
+        return RESPONSE_CACHE_PREFIX + hashlib.sha256(raw.encode()).hexdigest()
+    
+    async def _get_cached_response(self, key: str) -> Optional[Dict[str, Any]]:
+        """Look up a cached response, treating Redis errors as a miss."""
+        try:
+            cached = await self.memory.redis.get(key)
+        except redis.RedisError as e:
+            self.logger.warning("Response cache lookup failed: %s", e)
+            return None
+        
+        if cached is None:
+            self.cache_misses += 1
+            return None
+        
+        self.cache_hits += 1
+        return orjson.loads(cached)
+    
+    async def _get_session(self, session_id: str) -> Optional[Dict[str, Any]]:
+        """Load a session's stored context, treating Redis errors as no context."""
+        try:
+            return await self.memory.get_session(session_id)
+        except redis.RedisError as e:
+            self.logger.warning("Session context lookup failed: %s", e)
+            return None
+    
+    async def _cache_response(self, key: str, response: Dict[str, Any]):
+        """Store a response in the cache, ignoring Redis errors."""
+        try:
+            await self.memory.redis.set(key, orjson.dumps(response), ex=RESPONSE_CACHE_TTL)
+        except redis.RedisError as e:
+            self.logger.warning("Response cache store failed: %s", e)
+    
+    def _needs_planning(self, task: TaskRequest) -> bool:
         """Determine if a task needs complex planning."""
-        # Implementation here
-        return False
+        return _plan_decision(task.intent, len(task.description) // PLANNING_BUCKET_SIZE)
     
     async def _aggregate_results(self, results, plan) -> Dict[str, Any]:
         """Aggregate results from multiple tasks."""
-        return {"status": "completed", "results": results}
+        return {"status": "completed", "results": [r.to_internal() for r in results]}
     
     async def _format_single_result(self, result) -> Dict[str, Any]:
         """Format a single task result."""
@@ -3,34 +3,128 @@ Task planning and decomposition.
 """
 
 import logging
-from typing import List, Dict
-from dataclasses import dataclass
+import re
+from collections import deque
+from types import MappingProxyType
+from typing import List, Dict, Mapping, Sequence
+from dataclasses import dataclass, field
 from datetime import datetime
-from ...models.agent_models import TaskRequest
+from ...models.agent_models import (
+    TaskRequest, INTENT_CODE_GENERATION, INTENT_DOCUMENTATION, INTENT_TESTING
+)
 
-@dataclass
+@dataclass(slots=True, frozen=True, eq=False)
 class ExecutionPlan:
-    """Plan for executing a complex task."""
+    """Plan for executing a complex task as a graph of subtasks.
+    
+    Plans are immutable once built, so executors can share them across
+    coroutines without copying. They compare and hash by identity.
+    """
     id: str
     original_task: TaskRequest
-    subtasks: List[TaskRequest]
-    dependencies: Dict[str, List[str]]
+    subtasks: Sequence[TaskRequest]
+    dependencies: Mapping[str, Sequence[str]]  # subtask id -> prerequisite ids
     estimated_duration: int
+    # Derived from dependencies in __post_init__
+    roots: Sequence[str] = field(init=False)
+    reverse_deps: Mapping[str, Sequence[str]] = field(init=False)
+    priorities: Mapping[str, int] = field(init=False)  # longest path to a sink
+    
+    def __post_init__(self):
+        dependencies = {task_id: tuple(prereqs) for task_id, prereqs in self.dependencies.items()}
+        reverse_deps: Dict[str, List[str]] = {task.id: [] for task in self.subtasks}
+        for task_id, prerequisites in dependencies.items():
+            for prerequisite in prerequisites:
+                reverse_deps.setdefault(prerequisite, []).append(task_id)
+        
+        # Frozen dataclass: derived fields have to bypass __setattr__
+        object.__setattr__(self, "subtasks", tuple(self.subtasks))
+        object.__setattr__(self, "dependencies", MappingProxyType(dependencies))
+        object.__setattr__(self, "reverse_deps", MappingProxyType(
+            {task_id: tuple(dependents) for task_id, dependents in reverse_deps.items()}
+        ))
+        object.__setattr__(self, "roots", tuple(
+            task.id for task in self.subtasks if not dependencies.get(task.id)
+        ))
+        
+        # Critical-path priority: a node outranks everything downstream of it
+        priorities: Dict[str, int] = {}
+        for task_id in reversed(self._topological_order()):
+            priorities[task_id] = 1 + max(
+                (priorities.get(dependent, 0) for dependent in self.reverse_deps.get(task_id, ())),
+                default=0
+            )
+        object.__setattr__(self, "priorities", MappingProxyType(priorities))
+    
+    def _topological_order(self) -> List[str]:
+        """Order subtasks with Kahn's algorithm; nodes on a cycle are left out."""
+        in_degree = {task.id: 0 for task in self.subtasks}
+        for task_id, prerequisites in self.dependencies.items():
+            in_degree[task_id] = len(prerequisites)
+        
+        queue = deque(self.roots)
+        order = []
+        while queue:
+            task_id = queue.popleft()
+            order.append(task_id)
+            for dependent in self.reverse_deps.get(task_id, []):
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    queue.append(dependent)
+        return order
+    
+    def validate(self) -> List[str]:
+        """Check the plan is an acyclic graph and return a topological order."""
+        task_ids = {task.id for task in self.subtasks}
+        for task_id, prerequisites in self.dependencies.items():
+            unknown = [p for p in [task_id, *prerequisites] if p not in task_ids]
+            if unknown:
+                raise ValueError(f"Plan {self.id} references unknown subtasks: {unknown}")
+        
+        order = self._topological_order()
+        if len(order) != len(task_ids):
+            raise ValueError(f"Plan {self.id} contains a dependency cycle")
+        return order
 
 class TaskPlanner:
     """Plans complex tasks by breaking them into subtasks."""
     
+    TESTS_PATTERN = re.compile(r"\btests?\b", re.IGNORECASE)
+    DOCS_PATTERN = re.compile(r"\b(docs|documentation|document)\b", re.IGNORECASE)
+    
     def __init__(self, agent_registry):
         self.agent_registry = agent_registry
         self.logger = logging.getLogger("task_planner")
     
     async def create_plan(self, task: TaskRequest) -> ExecutionPlan:
         """Create an execution plan for a task."""
-        # Simple planning for now
+        subtasks = [task]
+        dependencies: Dict[str, List[str]] = {}
+        
+        # Code requests that also ask for tests/docs fan out after the code step
+        if task.intent == INTENT_CODE_GENERATION:
+            followups = []
+            if self.TESTS_PATTERN.search(task.description):
+                followups.append((INTENT_TESTING, "Write tests for"))
+            if self.DOCS_PATTERN.search(task.description):
+                followups.append((INTENT_DOCUMENTATION, "Write documentation for"))
+            
+            # Subtasks are derived from the already validated request
+            for intent, prefix in followups:
+                subtask = TaskRequest.model_construct(
+                    intent=intent,
+                    description=f"{prefix}: {task.description}",
+                    context=task.context,
+                    priority=task.priority,
+                    parent_task_id=task.id
+                )
+                subtasks.append(subtask)
+                dependencies[subtask.id] = [task.id]
+        
         return ExecutionPlan(
-            id="plan-1",
+            id=f"plan-{task.id}",
             original_task=task,
-            subtasks=[task],
-            dependencies={},
-            estimated_duration=60
+            subtasks=subtasks,
+            dependencies=dependencies,
+            estimated_duration=60 * len(subtasks)
         )
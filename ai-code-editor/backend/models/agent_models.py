@@ -3,11 +3,14 @@ Core data models for the Agentic Middleware system - Pydantic V2 Compatible.
 These models define the fundamental data structures used throughout the application.
 """
 
-import uuid
-from datetime import datetime
+import itertools
+import os
+import secrets
+from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Dict, List, Optional, Union
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+from typing import Annotated, Any, Dict, List, Optional, Union
+
+from pydantic import BaseModel, Field, field_validator, ConfigDict, StringConstraints
 
 
 # ============================================================================
@@ -24,6 +27,7 @@ class AgentType(str, Enum):
     SECURITY = "security"
     PLANNING = "planning"
     REVIEW = "review"
+    UNKNOWN = "unknown"
 
 class TaskStatus(str, Enum):
     """Task execution statuses."""
@@ -62,62 +66,87 @@ class MessageType(str, Enum):
     ERROR = "error"
     STATUS_UPDATE = "status_update"
 
+# Module-level aliases for members compared on hot paths (one LOAD_GLOBAL
+# instead of a class attribute lookup per comparison)
+INTENT_CODE_GENERATION = IntentType.CODE_GENERATION
+INTENT_INFRASTRUCTURE_SETUP = IntentType.INFRASTRUCTURE_SETUP
+INTENT_TESTING = IntentType.TESTING
+INTENT_DOCUMENTATION = IntentType.DOCUMENTATION
+STATUS_COMPLETED = TaskStatus.COMPLETED
+STATUS_FAILED = TaskStatus.FAILED
+AGENT_UNKNOWN = AgentType.UNKNOWN
+
 
 # ============================================================================
 # Core Data Models
 # ============================================================================
 
-class ExecutionContext(BaseModel):
+# Task ids are a per-process random prefix plus a monotonic counter; the
+# prefix is regenerated in forked workers so ids stay unique across processes
+_task_id_prefix = ""
+_task_id_counter = itertools.count()
+
+def _reset_task_ids():
+    global _task_id_prefix, _task_id_counter
+    _task_id_prefix = f"{secrets.token_hex(4)}{os.getpid():x}-"
+    _task_id_counter = itertools.count()
+
+_reset_task_ids()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_task_ids)
+
+def _next_task_id() -> str:
+    return f"{_task_id_prefix}{next(_task_id_counter):x}"
+
+# Stripped, non-empty string checked by pydantic-core instead of a Python validator
+NonEmptyStr = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+
+class SerializableModel(BaseModel):
+    """Base model with separate internal and API serialization paths."""
+    
+    def to_internal(self) -> Dict[str, Any]:
+        """Dump to a Python dict for memory, queue and inter-agent use."""
+        return self.model_dump(mode='python', exclude_none=True)
+    
+    def to_api(self) -> str:
+        """Dump to a JSON string for HTTP responses."""
+        return self.model_dump_json(by_alias=True, exclude_none=True)
+
+class ExecutionContext(SerializableModel):
     """Context information for agent execution."""
     model_config = ConfigDict(
-        json_encoders={datetime: lambda v: v.isoformat()},
-        use_enum_values=True
+        frozen=True,
+        extra='ignore'
     )
     
     session_id: str
     user_id: str
     project_id: str
-    workspace_path: str
+    workspace_path: NonEmptyStr
     environment: str = "development"
     language: Optional[str] = None
     framework: Optional[str] = None
     metadata: Dict[str, Any] = Field(default_factory=dict)
-    
-    @field_validator('workspace_path')
-    @classmethod
-    def validate_workspace_path(cls, v: str) -> str:
-        """Ensure workspace path is not empty."""
-        if not v or not v.strip():
-            raise ValueError("Workspace path cannot be empty")
-        return v.strip()
 
-class TaskRequest(BaseModel):
+class TaskRequest(SerializableModel):
     """Request to execute a task."""
     model_config = ConfigDict(
-        use_enum_values=True,
-        json_encoders={datetime: lambda v: v.isoformat()}
+        frozen=True,
+        extra='ignore'
     )
     
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=_next_task_id)
     intent: IntentType
-    description: str
+    description: NonEmptyStr
     context: ExecutionContext
     parameters: Dict[str, Any] = Field(default_factory=dict)
     priority: Priority = Priority.MEDIUM
     timeout: int = Field(default=300, description="Timeout in seconds")
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     parent_task_id: Optional[str] = None
     retry_count: int = 0
     max_retries: int = 3
     
-    @field_validator('description')
-    @classmethod
-    def validate_description(cls, v: str) -> str:
-        """Ensure description is not empty."""
-        if not v or not v.strip():
-            raise ValueError("Task description cannot be empty")
-        return v.strip()
-    
     @field_validator('timeout')
     @classmethod
     def validate_timeout(cls, v: int) -> int:
@@ -128,11 +157,11 @@ class TaskRequest(BaseModel):
             raise ValueError("Timeout cannot exceed 1 hour")
         return v
 
-class TaskResult(BaseModel):
+class TaskResult(SerializableModel):
     """Result of task execution."""
     model_config = ConfigDict(
-        use_enum_values=True,
-        json_encoders={datetime: lambda v: v.isoformat()}
+        frozen=True,
+        extra='ignore'
     )
     
     task_id: str
@@ -145,7 +174,7 @@ class TaskResult(BaseModel):
     cost: float = 0.0
     confidence_score: float = Field(default=1.0, ge=0.0, le=1.0)
     metadata: Dict[str, Any] = Field(default_factory=dict)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     completed_at: Optional[datetime] = None
     
     @field_validator('execution_time')
@@ -156,21 +185,25 @@ class TaskResult(BaseModel):
             raise ValueError("Execution time cannot be negative")
         return v
     
-    def mark_completed(self, result: Dict[str, Any] = None):
-        """Mark the task as completed."""
-        self.status = TaskStatus.COMPLETED
-        self.completed_at = datetime.utcnow()
+    def mark_completed(self, result: Dict[str, Any] = None) -> "TaskResult":
+        """Return a copy of this result marked as completed."""
+        update = {"status": TaskStatus.COMPLETED, "completed_at": datetime.now(timezone.utc)}
         if result:
-            self.result = result
+            update["result"] = result
+        return self.model_copy(update=update)
     
-    def mark_failed(self, error: str):
-        """Mark the task as failed."""
-        self.status = TaskStatus.FAILED
-        self.error = error
-        self.completed_at = datetime.utcnow()
+    def mark_failed(self, error: str) -> "TaskResult":
+        """Return a copy of this result marked as failed."""
+        return self.model_copy(update={
+            "status": TaskStatus.FAILED,
+            "error": error,
+            "completed_at": datetime.now(timezone.utc)
+        })
 
 class ChatMessage(BaseModel):
     """Chat message from user."""
+    model_config = ConfigDict(frozen=True, extra='ignore')
+    
     message: str
     session_id: str
     user_id: str = "default_user"
@@ -187,7 +220,7 @@ class ChatMessage(BaseModel):
             raise ValueError("Message cannot be empty")
         return v.strip()
 
-class ChatResponse(BaseModel):
+class ChatResponse(SerializableModel):
     """Response from the agentic system."""
     session_id: str
     response: Dict[str, Any]
@@ -297,75 +330,24 @@ def create_task_result(
     status: TaskStatus = TaskStatus.COMPLETED,
     result: Optional[Dict[str, Any]] = None,
     error: Optional[str] = None,
-    execution_time: float = 0.0
+    execution_time: float = 0.0,
+    trusted: bool = True
 ) -> TaskResult:
-    """Create a task result with defaults."""
-    task_result = TaskResult(
+    """Create a task result with defaults.
+    
+    Trusted results are built internally and skip validation; pass
+    ``trusted=False`` for data that crossed an API boundary.
+    """
+    factory = TaskResult.model_construct if trusted else TaskResult
+    return factory(
         task_id=task_id,
         agent_type=agent_type,
         status=status,
         result=result,
         error=error,
-        execution_time=execution_time
+        execution_time=execution_time,
+        completed_at=datetime.now(timezone.utc) if status == TaskStatus.COMPLETED else None
     )
-    
-    if status == TaskStatus.COMPLETED:
-        task_result.completed_at = datetime.utcnow()
-    
-    return task_result
-
-
-# ============================================================================
-# Test the Models
-# ============================================================================
-
-if __name__ == "__main__":
-    """Test the data models to ensure they work correctly."""
-    
-    print("🧪 Testing Pydantic V2 Compatible Data Models...")
-    
-    try:
-        # Test ExecutionContext
-        context = create_execution_context(
-            session_id="test-session-123",
-            user_id="developer-1", 
-            project_id="ai-editor-project",
-            workspace_path="/tmp/test-workspace"
-        )
-        print(f"✅ ExecutionContext created: {context.session_id}")
-        
-        # Test TaskRequest
-        task = create_task_request(
-            description="Create a FastAPI application with JWT authentication",
-            context=context,
-            intent=IntentType.CODE_GENERATION,
-            priority=Priority.HIGH
-        )
-        print(f"✅ TaskRequest created: {task.id}")
-        
-        # Test TaskResult
-        result = create_task_result(
-            task_id=task.id,
-            agent_type=AgentType.CODE,
-            status=TaskStatus.COMPLETED,
-            result={"code": "print('Hello, World!')", "language": "python"}
-        )
-        print(f"✅ TaskResult created: {result.status}")
-        
-        # Test ChatMessage  
-        chat_msg = ChatMessage(
-            message="Generate a Python function to calculate fibonacci numbers",
-            session_id="test-session",
-            user_id="developer",
-            project_id="fibonacci-project"
-        )
-        print(f"✅ ChatMessage created: {chat_msg.message[:50]}...")
-        
-        print("\n🎉 All tests passed! Pydantic V2 models are working correctly.")
-        
-    except Exception as e:
-        print(f"❌ Test failed: {e}")
-        raise
 
 
 # ============================================================================
@@ -376,8 +358,12 @@ __all__ = [
     # Enums
     "AgentType", "TaskStatus", "IntentType", "Priority", "MessageType",
     
+    # Enum member aliases
+    "INTENT_CODE_GENERATION", "INTENT_INFRASTRUCTURE_SETUP", "INTENT_TESTING",
+    "INTENT_DOCUMENTATION", "STATUS_COMPLETED", "STATUS_FAILED", "AGENT_UNKNOWN",
+    
     # Core Models
-    "ExecutionContext", "TaskRequest", "TaskResult",
+    "SerializableModel", "ExecutionContext", "TaskRequest", "TaskResult",
     
     # Request/Response
     "ChatMessage", "ChatResponse", "SystemStatus",
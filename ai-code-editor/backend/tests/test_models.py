@@ -0,0 +1,90 @@
+"""
+Tests for the Pydantic V2 data models.
+"""
+
+import pytest
+from pydantic import ValidationError
+
+from ..models.agent_models import (
+    AgentType, ChatMessage, IntentType, Priority, TaskStatus,
+    create_execution_context, create_task_request, create_task_result
+)
+
+
+@pytest.fixture
+def context():
+    return create_execution_context(
+        session_id="test-session-123",
+        user_id="developer-1",
+        project_id="ai-editor-project",
+        workspace_path="/tmp/test-workspace"
+    )
+
+
+def test_execution_context(context):
+    assert context.session_id == "test-session-123"
+    assert context.workspace_path == "/tmp/test-workspace"
+
+
+def test_execution_context_rejects_empty_workspace():
+    with pytest.raises(ValidationError):
+        create_execution_context(session_id="test", workspace_path="  ")
+
+
+def test_task_request(context):
+    task = create_task_request(
+        description="Create a FastAPI application with JWT authentication",
+        context=context,
+        intent=IntentType.CODE_GENERATION,
+        priority=Priority.HIGH
+    )
+    assert task.id
+    assert task.intent == IntentType.CODE_GENERATION
+    assert task.priority == Priority.HIGH
+
+
+def test_task_request_rejects_empty_description(context):
+    with pytest.raises(ValidationError):
+        create_task_request(description="", context=context)
+
+
+def test_task_result(context):
+    task = create_task_request(description="Create a Python function", context=context)
+    result = create_task_result(
+        task_id=task.id,
+        agent_type=AgentType.CODE,
+        status=TaskStatus.COMPLETED,
+        result={"code": "print('Hello, World!')", "language": "python"}
+    )
+    assert result.task_id == task.id
+    assert result.status == TaskStatus.COMPLETED
+    assert result.completed_at is not None
+
+
+def test_chat_message():
+    chat_msg = ChatMessage(
+        message="Generate a Python function to calculate fibonacci numbers",
+        session_id="test-session",
+        user_id="developer",
+        project_id="fibonacci-project"
+    )
+    assert chat_msg.message.startswith("Generate a Python function")
+    assert chat_msg.project_id == "fibonacci-project"
+
+
+def test_untrusted_task_result_is_validated():
+    with pytest.raises(ValidationError):
+        create_task_result(
+            task_id="task-1",
+            agent_type=AgentType.CODE,
+            execution_time=-1.0,
+            trusted=False
+        )
+
+
+def test_internal_dump_keeps_defaulted_fields():
+    result = create_task_result(task_id="task-1", agent_type=AgentType.CODE)
+    internal = result.to_internal()
+    assert internal["created_at"] == result.created_at
+    assert internal["tokens_used"] == 0
+    assert "error" not in internal
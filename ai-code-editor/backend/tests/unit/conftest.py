@@ -0,0 +1,26 @@
+"""
+Shared fixtures for the unit tests.
+"""
+
+import pytest
+
+
+class FakeRedis:
+    """In-memory stand-in for the async Redis client."""
+
+    def __init__(self):
+        self.data = {}
+
+    async def ping(self):
+        return True
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+
+
+@pytest.fixture
+def fake_redis():
+    return FakeRedis()
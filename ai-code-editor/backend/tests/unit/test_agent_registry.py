@@ -0,0 +1,35 @@
+"""
+Tests for the agent registry.
+"""
+
+import pytest
+
+from ...core.orchestration.agent_registry import AgentRegistry
+from ...models.agent_models import AgentType
+
+
+class StubAgent:
+    """Agent that only reports capabilities."""
+
+    agent_type = AgentType.CODE
+
+    def __init__(self):
+        self.capabilities = ["Generate Python code"]
+
+    def get_capabilities(self):
+        return self.capabilities
+
+
+def test_capabilities_cannot_be_mutated_through_the_registry():
+    registry = AgentRegistry()
+    agent = StubAgent()
+    registry.register_agent(agent)
+
+    capabilities = registry.get_all_capabilities()
+
+    assert capabilities == {AgentType.CODE: ("Generate Python code",)}
+    with pytest.raises(TypeError):
+        capabilities[AgentType.CODE] = ()
+    with pytest.raises(AttributeError):
+        capabilities[AgentType.CODE].append("Deploy")
+    assert agent.capabilities == ["Generate Python code"]
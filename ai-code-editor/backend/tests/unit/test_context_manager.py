@@ -0,0 +1,33 @@
+"""
+Tests for Redis-backed session context memory.
+"""
+
+import pytest
+import redis.asyncio as redis
+
+from ...core.memory.context_manager import ContextMemory
+
+
+@pytest.fixture
+def memory(fake_redis, monkeypatch):
+    memory = ContextMemory()
+    monkeypatch.setattr(memory, "redis", fake_redis)
+    return memory
+
+
+@pytest.mark.asyncio
+async def test_session_round_trip(memory):
+    await memory.save_session("a", {"language": "python"})
+
+    assert await memory.get_session("a") == {"language": "python"}
+    assert await memory.get_session("b") is None
+
+
+@pytest.mark.asyncio
+async def test_initialize_tolerates_unreachable_redis():
+    # Nothing listens on port 1
+    memory = ContextMemory("redis://127.0.0.1:1")
+
+    await memory.initialize()
+    with pytest.raises(redis.RedisError):
+        await memory.get_session("a")
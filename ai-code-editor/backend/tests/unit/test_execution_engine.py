@@ -0,0 +1,115 @@
+"""
+Tests for plan execution in the execution engine.
+"""
+
+import asyncio
+
+import pytest
+
+from ...core.orchestration.execution_engine import ExecutionEngine
+from ...core.orchestration.task_planner import ExecutionPlan
+from ...models.agent_models import (
+    AgentType, TaskStatus, create_execution_context, create_task_request, create_task_result
+)
+
+
+class RecordingAgent:
+    """Agent that records the order tasks start in, optionally pausing or failing per task."""
+
+    def __init__(self, delays=None, fail=()):
+        self.started = []
+        self.cancelled = set()
+        self.delays = delays or {}
+        self.fail = fail
+
+    async def execute(self, task):
+        self.started.append(task.id)
+        try:
+            await asyncio.sleep(self.delays.get(task.id, 0))
+        except asyncio.CancelledError:
+            self.cancelled.add(task.id)
+            raise
+        status = TaskStatus.FAILED if task.id in self.fail else TaskStatus.COMPLETED
+        return create_task_result(task_id=task.id, agent_type=AgentType.CODE, status=status)
+
+
+class SingleAgentRegistry:
+    """Registry that hands every task to the same agent."""
+
+    def __init__(self, agent):
+        self.agent = agent
+
+    def find_first_capable(self, task):
+        return self.agent
+
+
+@pytest.fixture
+def tasks():
+    context = create_execution_context(session_id="engine-session")
+    return [create_task_request(description=f"step {i}", context=context) for i in range(4)]
+
+
+def make_plan(tasks, dependencies):
+    return ExecutionPlan(
+        id="plan-test",
+        original_task=tasks[0],
+        subtasks=tasks,
+        dependencies=dependencies,
+        estimated_duration=60 * len(tasks)
+    )
+
+
+@pytest.mark.asyncio
+async def test_critical_path_runs_first(tasks):
+    single, head, middle, tail = tasks
+    plan = make_plan(tasks, {middle.id: [head.id], tail.id: [middle.id]})
+    agent = RecordingAgent()
+    engine = ExecutionEngine(SingleAgentRegistry(agent), memory=None, max_concurrent_tasks=1)
+
+    await engine.execute_plan(plan)
+
+    # head -> middle -> tail outranks the lone task at every step it is ready
+    assert agent.started[:2] == [head.id, middle.id]
+    assert set(agent.started) == {task.id for task in tasks}
+
+
+@pytest.mark.asyncio
+async def test_results_follow_subtask_order(tasks):
+    # Earlier subtasks finish last
+    agent = RecordingAgent(delays={task.id: 0.01 * (len(tasks) - i) for i, task in enumerate(tasks)})
+    engine = ExecutionEngine(SingleAgentRegistry(agent), memory=None)
+
+    results = await engine.execute_plan(make_plan(tasks, {}))
+
+    assert [result.task_id for result in results] == [task.id for task in tasks]
+
+
+@pytest.mark.asyncio
+async def test_failed_subtask_skips_its_dependents(tasks):
+    single, head, middle, tail = tasks
+    plan = make_plan(tasks, {middle.id: [head.id], tail.id: [middle.id]})
+    agent = RecordingAgent(fail={head.id})
+    engine = ExecutionEngine(SingleAgentRegistry(agent), memory=None)
+
+    results = await engine.execute_plan(plan)
+
+    assert set(agent.started) == {single.id, head.id}
+    assert [result.status for result in results] == [
+        TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.FAILED, TaskStatus.FAILED
+    ]
+    assert head.id in results[2].error and middle.id in results[3].error
+
+
+@pytest.mark.asyncio
+async def test_cancelling_plan_cancels_running_subtasks(tasks):
+    agent = RecordingAgent(delays={task.id: 10 for task in tasks})
+    engine = ExecutionEngine(SingleAgentRegistry(agent), memory=None)
+    running = asyncio.ensure_future(engine.execute_plan(make_plan(tasks, {})))
+    await asyncio.sleep(0.01)
+
+    running.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await running
+    await asyncio.sleep(0)
+
+    assert agent.cancelled == {task.id for task in tasks}
@@ -0,0 +1,50 @@
+"""
+Tests for intent classification and its in-process cache.
+"""
+
+import pytest
+
+from ...core.orchestration.intent_classifier import IntentClassifier
+from ...models.agent_models import INTENT_CODE_GENERATION, INTENT_TESTING, create_execution_context
+
+
+@pytest.fixture
+def classifier(monkeypatch):
+    classifier = IntentClassifier()
+    classifier.matched = []
+    match = classifier._match
+
+    def recording_match(user_input):
+        classifier.matched.append(user_input)
+        return match(user_input)
+
+    monkeypatch.setattr(classifier, "_match", recording_match)
+    return classifier
+
+
+@pytest.fixture
+def context():
+    return create_execution_context(session_id="classifier-session")
+
+
+@pytest.mark.asyncio
+async def test_classify_caches_exact_input(classifier, context):
+    assert await classifier.classify("Write tests for x", context) == INTENT_TESTING
+    assert await classifier.classify("Write tests for x", context) == INTENT_TESTING
+    assert await classifier.classify("write tests for x", context) == INTENT_TESTING
+
+    assert classifier.matched == ["Write tests for x", "write tests for x"]
+
+
+@pytest.mark.asyncio
+async def test_classify_batch_shares_the_cache(classifier, context):
+    await classifier.classify("write tests for x", context)
+
+    intents = await classifier.classify_batch(
+        ["write tests for x", "implement y", "implement y"], [context] * 3
+    )
+
+    assert intents == [INTENT_TESTING, INTENT_CODE_GENERATION, INTENT_CODE_GENERATION]
+    assert classifier.matched == ["write tests for x", "implement y", "implement y"]
+    assert await classifier.classify("implement y", context) == INTENT_CODE_GENERATION
+    assert len(classifier.matched) == 3
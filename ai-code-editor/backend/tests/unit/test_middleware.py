@@ -0,0 +1,91 @@
+"""
+Tests for request processing in the agentic middleware.
+"""
+
+import pytest
+import redis
+
+from ...core.orchestration.middleware import AgenticMiddleware
+from ...models.agent_models import AgentType, ChatMessage, create_task_result
+
+
+class EchoAgent:
+    """Agent that handles every task and echoes it back."""
+
+    agent_type = AgentType.CODE
+
+    def can_handle(self, task):
+        return True
+
+    async def execute(self, task):
+        return create_task_result(
+            task_id=task.id,
+            agent_type=self.agent_type,
+            result={"description": task.description, "parameters": task.parameters}
+        )
+
+
+@pytest.fixture
+def middleware(fake_redis, monkeypatch):
+    middleware = AgenticMiddleware()
+    monkeypatch.setattr(middleware.memory, "redis", fake_redis)
+    middleware.register_agent(EchoAgent())
+    return middleware
+
+
+@pytest.mark.asyncio
+async def test_batch_keeps_message_order(middleware):
+    messages = [
+        ChatMessage(message="generate a parser", session_id="a"),
+        ChatMessage(message="write tests for the parser", session_id="b"),
+        ChatMessage(message="generate a parser", session_id="a")
+    ]
+
+    responses = await middleware.process_batch(messages)
+
+    assert [r["result"]["description"] for r in responses] == [m.message for m in messages]
+
+
+@pytest.mark.asyncio
+async def test_batch_item_failure_is_isolated(middleware):
+    messages = [
+        ChatMessage(message="generate a parser", session_id="a"),
+        ChatMessage(message="generate a lexer", session_id="b", workspace_path="  "),
+        ChatMessage(message="write tests for the parser", session_id="c")
+    ]
+
+    first, bad, last = await middleware.process_batch(messages)
+
+    assert bad["status"] == "failed"
+    assert first["result"]["description"] == "generate a parser"
+    assert last["result"]["description"] == "write tests for the parser"
+
+
+@pytest.mark.asyncio
+async def test_responses_are_not_shared_across_sessions(middleware):
+    await middleware.memory.save_session("a", {"owner": "a"})
+    first = ChatMessage(message="generate a parser", session_id="a")
+    second = ChatMessage(message="generate a parser", session_id="b")
+
+    own = await middleware.process_request(first.message, middleware.get_context(first))
+    other = await middleware.process_request(second.message, middleware.get_context(second))
+    batched = await middleware.process_batch([first, second])
+
+    assert own["result"]["parameters"] == {"session_context": {"owner": "a"}}
+    assert other["result"]["parameters"] == {}
+    assert batched == [own, other]
+
+
+@pytest.mark.asyncio
+async def test_session_lookup_failure_is_not_fatal(middleware, monkeypatch):
+    async def unavailable(session_id):
+        raise redis.ConnectionError("Redis is down")
+
+    monkeypatch.setattr(middleware.memory, "get_session", unavailable)
+    message = ChatMessage(message="generate a parser", session_id="a")
+
+    single = await middleware.process_request(message.message, middleware.get_context(message))
+    batched = await middleware.process_batch([message])
+
+    assert single["status"] == "completed"
+    assert batched == [single]
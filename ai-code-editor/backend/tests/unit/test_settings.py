@@ -0,0 +1,25 @@
+"""
+Tests for lazy application settings.
+"""
+
+import importlib
+import types
+
+from ... import config
+from ...config import settings
+
+
+def test_importing_config_does_not_build_settings():
+    settings.get_settings.cache_clear()
+
+    importlib.reload(config)
+
+    assert settings.get_settings.cache_info().currsize == 0
+    assert isinstance(config.settings, types.ModuleType)
+
+
+def test_settings_are_built_once_on_first_use():
+    settings.get_settings.cache_clear()
+
+    assert settings.settings is settings.get_settings()
+    assert settings.get_settings.cache_info().misses == 1
@@ -0,0 +1,79 @@
+"""
+Tests for task planning and execution plan validation.
+"""
+
+import pytest
+
+from ...core.orchestration.task_planner import ExecutionPlan, TaskPlanner
+from ...models.agent_models import (
+    INTENT_CODE_GENERATION, INTENT_DOCUMENTATION, INTENT_TESTING,
+    create_execution_context, create_task_request
+)
+
+
+@pytest.fixture
+def context():
+    return create_execution_context(session_id="planner-session")
+
+
+def make_plan(tasks, dependencies):
+    return ExecutionPlan(
+        id="plan-test",
+        original_task=tasks[0],
+        subtasks=tasks,
+        dependencies=dependencies,
+        estimated_duration=60 * len(tasks)
+    )
+
+
+@pytest.mark.asyncio
+async def test_code_request_fans_out_after_code_step(context):
+    task = create_task_request(
+        description="Build a parser with tests and documentation",
+        context=context,
+        intent=INTENT_CODE_GENERATION
+    )
+    plan = await TaskPlanner(agent_registry=None).create_plan(task)
+
+    code, tests, docs = plan.subtasks
+    assert code is task
+    assert tests.intent == INTENT_TESTING
+    assert docs.intent == INTENT_DOCUMENTATION
+    assert plan.roots == (task.id,)
+    assert plan.validate() == [task.id, tests.id, docs.id]
+    assert plan.priorities == {task.id: 2, tests.id: 1, docs.id: 1}
+
+
+def test_plan_with_cycle_is_rejected(context):
+    first = create_task_request(description="first", context=context)
+    second = create_task_request(description="second", context=context)
+    plan = make_plan([first, second], {first.id: [second.id], second.id: [first.id]})
+
+    with pytest.raises(ValueError, match="cycle"):
+        plan.validate()
+
+
+def test_plan_with_unknown_subtask_is_rejected(context):
+    task = create_task_request(description="only", context=context)
+    plan = make_plan([task], {task.id: ["missing"]})
+
+    with pytest.raises(ValueError, match="unknown subtasks"):
+        plan.validate()
+
+
+def test_plan_derived_fields_are_not_constructor_arguments(context):
+    task = create_task_request(description="only", context=context)
+
+    with pytest.raises(TypeError):
+        ExecutionPlan(
+            id="plan-test",
+            original_task=task,
+            subtasks=[task],
+            dependencies={},
+            estimated_duration=60,
+            roots=()
+        )
+
+    plan = make_plan([task], {})
+    assert plan.roots == (task.id,)
+    assert {plan: "hashable"}[plan] == "hashable"
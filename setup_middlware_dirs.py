@@ -4,75 +4,36 @@ Setup Script - Organize Agentic Middleware in Correct Directory Structure
 This script takes the middleware files and organizes them properly within the project structure.
 """
 
+import asyncio
+import hashlib
 import os
 import shutil
-from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 
-def setup_middleware_structure():
-    """Setup the middleware in the correct directory structure."""
-    
-    # Base directory (assumes we're in the project root)
-    base_dir = Path("ai-code-editor")
-    backend_dir = base_dir / "backend"
-    
-    print("🏗️ Setting up Agentic Middleware directory structure...")
-    
-    # Create the directory structure if it doesn't exist
-    directories_to_create = [
-        # Core orchestration
-        "core/orchestration",
-        "core/memory", 
-        "core/llm/providers",
-        
-        # Agent directories
-        "agents/base",
-        "agents/code/generators",
-        "agents/code/parsers", 
-        "agents/code/validators",
-        "agents/infrastructure/cloud_providers",
-        "agents/testing/generators",
-        "agents/testing/runners",
-        "agents/devops/ci_generators",
-        "agents/devops/deployment",
-        "agents/documentation/generators",
-        "agents/documentation/parsers",
-        "agents/security/scanners",
-        "agents/security/policies",
-        
-        # API integration
-        "api/v1",
-        
-        # Configuration
-        "config"
-    ]
-    
-    # Create directories
-    for dir_path in directories_to_create:
-        full_path = backend_dir / dir_path
-        full_path.mkdir(parents=True, exist_ok=True)
-        
-        # Create __init__.py files for Python packages
-        init_file = full_path / "__init__.py"
-        if not init_file.exists():
-            init_file.touch()
-        
-        print(f"📁 Created: {full_path}")
-    
-    # Create the main middleware files
-    create_middleware_files(backend_dir)
-    
-    print("✅ Middleware structure setup complete!")
-    print("\n📋 Next steps:")
-    print("1. cd ai-code-editor/backend")
-    print("2. pip install -r requirements.txt")
-    print("3. python -m app.main  # Start the server")
+try:
+    import aiofiles
+    import aiofiles.os
+except ImportError:  # Optional; fall back to asyncio's default thread pool
+    aiofiles = None
 
-def create_middleware_files(backend_dir: Path):
-    """Create the core middleware files with proper imports."""
-    
-    # 1. Main middleware file
-    middleware_file = backend_dir / "core/orchestration/middleware.py"
-    middleware_content = '''"""
+try:
+    import liburing
+except ImportError:  # Optional, Linux only
+    liburing = None
+
+URING_ENTRIES = 64
+MAX_WORKERS = 16
+STAMP_NAME = ".setup_stamp"
+_WRITE_FLAGS = (
+    os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    | getattr(os, "O_BINARY", 0) | getattr(os, "O_CLOEXEC", 0)
+)
+_CREATE_FLAGS = (_WRITE_FLAGS & ~os.O_TRUNC) | os.O_EXCL
+_DIR_FLAGS = os.O_RDONLY | getattr(os, "O_DIRECTORY", 0) | getattr(os, "O_CLOEXEC", 0)
+_HAS_DIR_FD = os.mkdir in os.supports_dir_fd and hasattr(os, "O_DIRECTORY")
+
+# Main middleware file
+_MIDDLEWARE_CONTENT = b'''"""
 Main Agentic Middleware class - orchestrates all AI agents.
 """
 
@@ -163,13 +124,9 @@ class AgenticMiddleware:
         """Format a single task result."""
         return {"status": result.status.value, "result": result.result}
 '''
-    
-    with open(middleware_file, 'w') as f:
-        f.write(middleware_content)
-    
-    # 2. Intent classifier
-    intent_file = backend_dir / "core/orchestration/intent_classifier.py"
-    intent_content = '''"""
+
+# Intent classifier
+_INTENT_CONTENT = b'''"""
 Intent classification for understanding user requests.
 """
 
@@ -213,13 +170,9 @@ class IntentClassifier:
         
         return IntentType.CODE_GENERATION
 '''
-    
-    with open(intent_file, 'w') as f:
-        f.write(intent_content)
-    
-    # 3. Agent registry
-    registry_file = backend_dir / "core/orchestration/agent_registry.py"
-    registry_content = '''"""
+
+# Agent registry
+_REGISTRY_CONTENT = b'''"""
 Registry for managing available agents.
 """
 
@@ -258,13 +211,9 @@ class AgentRegistry:
             capabilities[agent_type] = agent.get_capabilities()
         return capabilities
 '''
-    
-    with open(registry_file, 'w') as f:
-        f.write(registry_content)
-    
-    # 4. Task planner
-    planner_file = backend_dir / "core/orchestration/task_planner.py"
-    planner_content = '''"""
+
+# Task planner
+_PLANNER_CONTENT = b'''"""
 Task planning and decomposition.
 """
 
@@ -301,13 +250,9 @@ class TaskPlanner:
             estimated_duration=60
         )
 '''
-    
-    with open(planner_file, 'w') as f:
-        f.write(planner_content)
-    
-    # 5. Execution engine
-    execution_file = backend_dir / "core/orchestration/execution_engine.py"
-    execution_content = '''"""
+
+# Execution engine
+_EXECUTION_CONTENT = b'''"""
 Execution engine for running agent workflows.
 """
 
@@ -364,29 +309,9 @@ class ExecutionEngine:
             results.append(result)
         return results
 '''
-    
-    with open(execution_file, 'w') as f:
-        f.write(execution_content)
-    
-    # 6. Create package __init__.py files
-    init_files = [
-        backend_dir / "core/__init__.py",
-        backend_dir / "core/orchestration/__init__.py",
-        backend_dir / "core/memory/__init__.py", 
-        backend_dir / "core/llm/__init__.py",
-        backend_dir / "agents/__init__.py",
-        backend_dir / "agents/base/__init__.py"
-    ]
-    
-    for init_file in init_files:
-        if not init_file.exists():
-            with open(init_file, 'w') as f:
-                f.write('"""Package initialization."""\n')
-    
-    # Main orchestration __init__.py with exports
-    orchestration_init = backend_dir / "core/orchestration/__init__.py"
-    with open(orchestration_init, 'w') as f:
-        f.write('''"""
+
+# Main orchestration __init__.py with exports
+_ORCHESTRATION_INIT_CONTENT = b'''"""
 Core orchestration components for the Agentic Middleware.
 """
 
@@ -405,15 +330,10 @@ __all__ = [
     'ExecutionPlan',
     'ExecutionEngine'
 ]
-''')
-    
-    print("📝 Created core middleware files")
+'''
 
-def create_example_main_app(backend_dir: Path):
-    """Create an example main application file."""
-    
-    main_file = backend_dir / "app/main.py"
-    main_content = '''"""
+# Example main application
+_MAIN_CONTENT = b'''"""
 Main FastAPI application with Agentic Middleware integration.
 """
 
@@ -484,11 +404,317 @@ if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
 '''
+
+# Generated sources written by create_middleware_files, relative to the backend directory
+_FILES = (
+    ("core/orchestration/middleware.py", _MIDDLEWARE_CONTENT),
+    ("core/orchestration/intent_classifier.py", _INTENT_CONTENT),
+    ("core/orchestration/agent_registry.py", _REGISTRY_CONTENT),
+    ("core/orchestration/task_planner.py", _PLANNER_CONTENT),
+    ("core/orchestration/execution_engine.py", _EXECUTION_CONTENT),
+    ("core/orchestration/__init__.py", _ORCHESTRATION_INIT_CONTENT)
+)
+
+# Package directories to create, relative to the backend directory
+_DIR_LEAVES = (
+    # Core orchestration
+    "core/orchestration",
+    "core/memory", 
+    "core/llm/providers",
+    
+    # Agent directories
+    "agents/base",
+    "agents/code/generators",
+    "agents/code/parsers", 
+    "agents/code/validators",
+    "agents/infrastructure/cloud_providers",
+    "agents/testing/generators",
+    "agents/testing/runners",
+    "agents/devops/ci_generators",
+    "agents/devops/deployment",
+    "agents/documentation/generators",
+    "agents/documentation/parsers",
+    "agents/security/scanners",
+    "agents/security/policies",
+    
+    # API integration
+    "api/v1",
+    
+    # Configuration
+    "config"
+)
+
+# Intermediate packages that get a docstring-only __init__.py unless they already have one;
+# every _DIR_LEAVES package gets an empty one instead
+_PLACEHOLDER_PACKAGES = ("core", "core/llm", "agents")
+_PLACEHOLDER_INIT_CONTENT = b'"""Package initialization."""\n'
+
+# Identifies this exact layout and content in the stamp file
+_FINGERPRINT = hashlib.blake2b(
+    repr((_DIR_LEAVES, _PLACEHOLDER_PACKAGES, _PLACEHOLDER_INIT_CONTENT, _FILES)).encode()
+).hexdigest()
+
+def uring_batch(ring, prepare, items, results=None):
+    """Submit one SQE per item, a ring's worth per syscall, and return the results.
+    
+    Results are appended to ``results`` as they complete, so a caller passing
+    its own list still sees them if a later submission fails.
+    """
+    cqe = liburing.Cqe()
+    results = [] if results is None else results
+    for start in range(0, len(items), URING_ENTRIES):
+        chunk = items[start:start + URING_ENTRIES]
+        for item in chunk:
+            prepare(liburing.io_uring_get_sqe(ring), item)
+        liburing.io_uring_submit_and_wait(ring, len(chunk))
+        for _ in chunk:
+            try:
+                liburing.io_uring_wait_cqe(ring, cqe)
+                results.append(cqe[0].res)
+            except FileExistsError:
+                pass
+            finally:
+                liburing.io_uring_cq_advance(ring, 1)
+    return results
+
+def join_path(base: str, rel_path: str) -> str:
+    """Join a '/'-separated relative path onto a base directory using native separators."""
+    return os.path.join(base, *rel_path.split("/"))
+
+def directory_levels(full_paths):
+    """Group every directory component by depth, listing each path exactly once."""
+    levels = {}
+    for path in full_paths:
+        while path and path != os.path.dirname(path):
+            levels.setdefault(path.count(os.sep), set()).add(path)
+            path = os.path.dirname(path)
+    return [sorted(levels[depth]) for depth in sorted(levels)]
+
+def build_targets(backend_dir: str):
+    """List every file to write as (path, content, overwrite), one entry per path."""
+    targets = {}
+    for package in _PLACEHOLDER_PACKAGES:
+        targets[join_path(backend_dir, package + "/__init__.py")] = (_PLACEHOLDER_INIT_CONTENT, False)
+    for leaf in _DIR_LEAVES:
+        targets[join_path(backend_dir, leaf + "/__init__.py")] = (b"", False)
+    for rel_path, content in _FILES:
+        targets[join_path(backend_dir, rel_path)] = (content, True)
+    return [(path, content, overwrite) for path, (content, overwrite) in targets.items()]
+
+def split_levels(levels, base: str):
+    """Split depth levels into paths up to base and paths below it, the latter relative to base."""
+    prefix = base + os.sep
+    outer, inner = [], []
+    for level in levels:
+        above = [path for path in level if not path.startswith(prefix)]
+        below = [path[len(prefix):] for path in level if path.startswith(prefix)]
+        if above:
+            outer.append(above)
+        if below:
+            inner.append(below)
+    return outer, inner
+
+def existing_paths(base: str, wanted) -> set:
+    """Collect what already exists under base with one walk, entering only wanted directories."""
+    existing = set()
+    for root, dirs, files in os.walk(base):
+        existing.add(root)
+        existing.update(os.path.join(root, name) for name in files)
+        dirs[:] = [name for name in dirs if os.path.join(root, name) in wanted]
+    
+    # Anything above an existing base exists too
+    path = base
+    while existing and path and path != os.path.dirname(path):
+        existing.add(path)
+        path = os.path.dirname(path)
+    return existing
+
+def create_package_dirs_uring(base: str, levels, init_files):
+    """Create package directories and __init__.py files with batched io_uring submissions."""
+    outer, inner = split_levels(levels, base)
+    ring = liburing.Ring()
+    liburing.io_uring_queue_init(URING_ENTRIES, ring)
+    try:
+        # One batch per depth level, so no batch depends on itself
+        for level in outer:
+            uring_batch(ring, lambda sqe, path: liburing.io_uring_prep_mkdir(sqe, path, 0o755), level)
+        
+        # Resolve base once; everything below it is created relative to its fd
+        base_fd = os.open(base, _DIR_FLAGS)
+        try:
+            for level in inner:
+                uring_batch(
+                    ring,
+                    lambda sqe, path: liburing.io_uring_prep_mkdir(sqe, path, 0o755, dfd=base_fd),
+                    level
+                )
+            
+            # O_CREAT without O_TRUNC leaves existing __init__.py files untouched;
+            # the relative paths live in a list so they outlive the submission
+            rel_init_files = [path[len(base) + 1:] for path in init_files]
+            fds = []
+            try:
+                uring_batch(
+                    ring,
+                    lambda sqe, path: liburing.io_uring_prep_open(
+                        sqe, path, os.O_WRONLY | os.O_CREAT | os.O_CLOEXEC, 0o666, dfd=base_fd
+                    ),
+                    rel_init_files,
+                    fds
+                )
+            except BaseException:
+                # Don't leak the files opened before the failure
+                for fd in fds:
+                    os.close(fd)
+                raise
+            uring_batch(ring, liburing.io_uring_prep_close, fds)
+        finally:
+            os.close(base_fd)
+    finally:
+        liburing.io_uring_queue_exit(ring)
+
+async def make_dir(path: str, dir_fd: int = None):
+    """Create a single directory whose parent exists, without blocking the loop."""
+    try:
+        if aiofiles is not None:
+            await aiofiles.os.mkdir(path, dir_fd=dir_fd)
+        else:
+            await asyncio.to_thread(os.mkdir, path, dir_fd=dir_fd)
+    except FileExistsError:
+        pass
+
+async def create_init_file(init_file: str, content: bytes = b""):
+    """Create an __init__.py unless one already exists."""
+    # Exclusive create replaces a separate exists() probe
+    try:
+        if aiofiles is not None:
+            async with aiofiles.open(init_file, 'xb', buffering=0) as f:
+                await f.write(content)
+        else:
+            await asyncio.to_thread(write_preallocated, init_file, content, _CREATE_FLAGS)
+    except FileExistsError:
+        pass
+
+def preallocate(fd: int, size: int):
+    """Reserve a file's blocks up front so the write does not allocate as it goes."""
+    if size and hasattr(os, "posix_fallocate"):
+        try:
+            os.posix_fallocate(fd, 0, size)
+        except OSError:
+            pass  # Not every filesystem supports preallocation
+
+def write_preallocated(path: str, content: bytes, flags: int = _WRITE_FLAGS):
+    """Write pre-encoded file content into preallocated space."""
+    # Raw fd writes straight from the bytes object, skipping BufferedWriter's copy
+    fd = os.open(path, flags, 0o666)
+    try:
+        preallocate(fd, len(content))
+        view = memoryview(content)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+async def write_file(path: str, content: bytes):
+    """Write pre-encoded file content without blocking the event loop."""
+    if aiofiles is not None:
+        async with aiofiles.open(path, 'wb', buffering=0) as f:
+            preallocate(f.fileno(), len(content))
+            view = memoryview(content)
+            while view:
+                view = view[await f.write(view):]
+    else:
+        await asyncio.to_thread(write_preallocated, path, content)
+
+async def setup_middleware_structure():
+    """Setup the middleware in the correct directory structure."""
+    
+    # Base directory (assumes we're in the project root)
+    backend_dir = os.path.join("ai-code-editor", "backend")
+    
+    print("🏗️ Setting up Agentic Middleware directory structure...")
+    
+    # Skip everything when a previous run already set up this exact structure
+    stamp = os.path.join(backend_dir, STAMP_NAME)
+    try:
+        with open(stamp, 'rb') as f:
+            if f.read() == _FINGERPRINT.encode():
+                print("✅ Middleware structure is already up to date")
+                return
+    except OSError:
+        pass
+    
+    # One target list drives everything; the directories are derived from it
+    targets = build_targets(backend_dir)
+    levels = directory_levels({os.path.dirname(path) for path, _, _ in targets})
+    
+    # On a rerun most paths exist already; skip them without a syscall each
+    existing = existing_paths(backend_dir, {path for level in levels for path in level})
+    missing_levels = [
+        missing for missing in ([path for path in level if path not in existing] for level in levels)
+        if missing
+    ]
+    pending = [target for target in targets if target[2] or target[0] not in existing]
+    
+    # Create each directory component once, shallowest first
+    try:
+        if liburing is None:
+            raise OSError("liburing is not installed")
+        empty_init_files = [path for path, content, overwrite in pending if not content and not overwrite]
+        if missing_levels or empty_init_files:
+            await asyncio.to_thread(
+                create_package_dirs_uring, backend_dir, missing_levels, empty_init_files
+            )
+        pending = [target for target in pending if target[1] or target[2]]
+    except (OSError, AttributeError, TypeError):
+        # Also covers liburing bindings whose API differs from the one used here
+        outer, inner = split_levels(missing_levels, backend_dir) if _HAS_DIR_FD else (missing_levels, [])
+        for level in outer:
+            await asyncio.gather(*[make_dir(path) for path in level])
+        if inner:
+            # Resolve backend_dir once instead of once per directory below it
+            base_fd = os.open(backend_dir, _DIR_FLAGS)
+            try:
+                for level in inner:
+                    await asyncio.gather(*[make_dir(path, base_fd) for path in level])
+            finally:
+                os.close(base_fd)
+    
+    # One write for the whole listing rather than one per directory
+    print("\n".join(f"📁 Created: {join_path(backend_dir, leaf)}" for leaf in _DIR_LEAVES))
+    
+    # Create the __init__.py and middleware files
+    await create_middleware_files(pending)
+    write_preallocated(stamp, _FINGERPRINT.encode())
     
-    with open(main_file, 'w') as f:
-        f.write(main_content)
+    print("✅ Middleware structure setup complete!")
+    print("\n📋 Next steps:")
+    print("1. cd ai-code-editor/backend")
+    print("2. pip install -r requirements.txt")
+    print("3. python -m app.main  # Start the server")
+
+async def create_middleware_files(targets):
+    """Write (path, content, overwrite) targets concurrently into existing directories."""
+    await asyncio.gather(*[
+        write_file(path, content) if overwrite else create_init_file(path, content)
+        for path, content, overwrite in targets
+    ])
+    
+    print("📝 Created core middleware files")
+
+def create_example_main_app(backend_dir):
+    """Create an example main application file."""
+    
+    main_file = join_path(os.fspath(backend_dir), "app/main.py")
+    write_preallocated(main_file, _MAIN_CONTENT)
     
     print("📝 Created main application file")
 
+async def main():
+    """Run the setup with a fixed-size thread pool behind every blocking mkdir and write."""
+    # aiofiles and asyncio.to_thread both dispatch to the loop's default executor
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(MAX_WORKERS))
+    await setup_middleware_structure()
+
 if __name__ == "__main__":
-    setup_middleware_structure()
\ No newline at end of file
+    asyncio.run(main())
\ No newline at end of file